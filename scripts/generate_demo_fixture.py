@@ -11,14 +11,35 @@ without requiring any live API calls.
 
 Run: python scripts/generate_demo_fixture.py
 Validate: python scripts/generate_demo_fixture.py --validate
+Debug (indented output): python scripts/generate_demo_fixture.py --pretty
+MessagePack output: python scripts/generate_demo_fixture.py --format msgpack
+Compressed output: python scripts/generate_demo_fixture.py --compress
 """
 
 import argparse
+import gzip
+import hashlib
+import io
 import json
+import operator
 import random
-from datetime import datetime, timedelta, timezone
+import shutil
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json fallback below
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional: only needed for --format msgpack
+    msgpack = None
+
 # Import existing generators for raw data
 from load_demo_data import (
     BASE_TIME,
@@ -30,15 +51,60 @@ from load_demo_data import (
 # Base timestamp for scenario (matches load_demo_data.py)
 FIXTURE_BASE_TIME = datetime(2026, 2, 5, 0, 0, 0, tzinfo=timezone.utc)
 
+# Shared record values (one object referenced by every event/alert)
+REGION = "Taiwan Strait"
+NARRATIVE_EVENT_TYPE = "narrative_coordination"
+MOVEMENT_EVENT_TYPE = "military_movement"
+
 # Demo timing constants
 SIMULATED_HOURS = 72
 NORMAL_DURATION_SECONDS = 300  # 5 minutes at "Normal" speed
 SECONDS_PER_HOUR = NORMAL_DURATION_SECONDS / SIMULATED_HOURS  # ~4.167 seconds per simulated hour
+DEMO_SECONDS_PER_SCENARIO_SECOND = SECONDS_PER_HOUR / 3600  # Scale for raw epoch-second deltas
+BATCH_WINDOW_HOURS = 2  # Records within the same 2 simulated hours share a _demo_batch id
+
+# Scenario timestamp for every whole simulated hour, computed once at import
+# (beat events and detection_history entries index into this instead of
+# rebuilding the same datetime per record). Built from epoch seconds so no
+# intermediate timedelta objects are created.
+BASE_TS = FIXTURE_BASE_TIME.timestamp()
+TIME_AT = {
+    h: datetime.fromtimestamp(BASE_TS + h * 3600, tz=timezone.utc)
+    for h in range(SIMULATED_HOURS + 1)
+}
+
+# ISO strings for the TIME_AT datetimes, formatted once for the stdlib json
+# fallback (orjson formats datetimes in C and does not use these)
+ISO_AT = {dt: dt.isoformat() for dt in TIME_AT.values()}
+
+# Fixed RNG seed for offset jitter so repeated runs produce the same fixture
+FIXTURE_SEED = 20260205
+
+# Output buffer for streamed fixture writes (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Leading bytes of every gzip stream
+GZIP_MAGIC = b"\x1f\x8b"
+
+# gzip level for --compress output. Level 1 favours encode speed: on the
+# current fixture it compresses about 4.6x in roughly half the time of zlib's
+# default level 6 (about 6x), because the fixture is mostly repeated keys
+# and strings.
+GZIP_LEVEL = 1
 
+# Source files the fixture content depends on (hashed for the build cache)
+FIXTURE_SOURCES = (Path(__file__), Path(__file__).parent / "load_demo_data.py")
 
+# Repo-local build cache (gitignored), so only this checkout can write to it
+FIXTURE_CACHE_DIR = Path(__file__).parent / ".fixture_cache"
+
+
+@lru_cache(maxsize=None)
 def hours_to_demo_offset(hours: float) -> float:
     """Convert simulated hours to demo playback offset in seconds.
 
+    Scenario items sit on a small set of whole hours, so results are cached.
+
     Args:
         hours: Simulated time in hours (0-72)
 
@@ -48,700 +114,544 @@ def hours_to_demo_offset(hours: float) -> float:
     return (hours / SIMULATED_HOURS) * NORMAL_DURATION_SECONDS
 
 
-def add_jitter(offset: float, max_jitter: float = 3.0) -> float:
-    """Add random jitter to prevent exact timestamp collisions.
+def add_jitter_many(offsets: list[float], max_jitter: float = 3.0) -> list[float]:
+    """Add random jitter to a batch of offsets to prevent exact timestamp collisions.
+
+    Each offset gets one uniform(0.1, max_jitter) draw, taken in input order.
 
     Args:
-        offset: Base offset in seconds
+        offsets: Base offsets in seconds
         max_jitter: Maximum jitter to add (default 3 seconds)
 
     Returns:
-        Offset with jitter added
+        Offsets with jitter added, in input order
     """
-    return offset + random.uniform(0.1, max_jitter)
+    # Same distribution as random.uniform(0.1, max_jitter), minus the call layer
+    rand = random.random
+    span = max_jitter - 0.1
+    return [offset + 0.1 + span * rand() for offset in offsets]
 
 
-def convert_datetimes_to_iso(obj):
-    """Recursively convert datetime objects to ISO strings for JSON serialization.
+def _json_default(obj):
+    """Serialize datetime objects for the stdlib json fallback.
 
     Args:
-        obj: Object to convert (dict, list, datetime, or primitive)
+        obj: Object the json encoder could not serialize
 
     Returns:
-        Object with all datetimes converted to ISO strings
+        ISO format string for datetimes
+
+    Raises:
+        TypeError: If obj is not a datetime
     """
     if isinstance(obj, datetime):
+        # Same tzinfo and same instant means same ISO string, so a UTC hit in
+        # the precomputed table is safe to reuse
+        if obj.tzinfo is timezone.utc:
+            iso = ISO_AT.get(obj)
+            if iso is not None:
+                return iso
         return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {k: convert_datetimes_to_iso(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_datetimes_to_iso(item) for item in obj]
-    else:
-        return obj
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
-def generate_narrative_events() -> list[dict]:
-    """Generate pre-computed narrative events following 5-beat arc.
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize a single JSON value to bytes.
 
-    Returns:
-        List of narrative event records with demo metadata
+    Uses orjson when installed (serializes datetimes natively), otherwise
+    falls back to stdlib json with a datetime default handler. Output is
+    compact unless pretty is set.
     """
-    events = []
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, default=_json_default, indent=2).encode()
+    return json.dumps(obj, default=_json_default, separators=(",", ":")).encode()
 
-    # Beat 1: Baseline (T+0-14h) - 1 event
-    events.append({
-        "hours_offset": 12,
-        "data": {
-            "event_type": "narrative_coordination",
-            "summary": "Routine cross-strait coverage with peaceful development themes",
-            "confidence": 35,
-            "source_ids": [1, 2, 3, 4],
-            "coordination_score": 12,
-            "outlet_count": 2,
-            "synchronized_phrases": ["peaceful development", "cross-strait cooperation"],
-            "geographic_focus": "Taiwan Strait",
-            "themes": ["cooperation"],
-            "article_ids": [1, 2, 3, 4],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=12)).isoformat(),
-        }
-    })
 
-    # Beat 2: First signals (T+14-28h) - 2 events
-    events.append({
-        "hours_offset": 18,
-        "data": {
-            "event_type": "narrative_coordination",
-            "summary": "Increased sovereignty messaging across multiple state outlets",
-            "confidence": 55,
-            "source_ids": [21, 22, 23],
-            "coordination_score": 35,
-            "outlet_count": 2,
-            "synchronized_phrases": ["sovereignty non-negotiable", "territorial integrity"],
-            "geographic_focus": "Taiwan Strait",
-            "themes": ["sovereignty"],
-            "article_ids": [21, 22, 23],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=18)).isoformat(),
-        }
-    })
+def _open_fixture(path: Path, mode: str):
+    """Open a fixture file in binary mode, transparently handling gzip.
 
-    events.append({
-        "hours_offset": 26,
-        "data": {
-            "event_type": "narrative_coordination",
-            "summary": "Reunification messaging with coordinated phrasing",
-            "confidence": 60,
-            "source_ids": [24, 25, 26, 27],
-            "coordination_score": 42,
-            "outlet_count": 3,
-            "synchronized_phrases": ["reunification inevitable", "historical responsibility"],
-            "geographic_focus": "Taiwan Strait",
-            "themes": ["sovereignty", "reunification"],
-            "article_ids": [24, 25, 26, 27],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=26)).isoformat(),
-        }
-    })
+    Writes are compressed when the path ends in ".gz". Reads sniff the gzip
+    magic bytes instead, so a compressed fixture loads whatever it is named.
 
-    # Beat 3: Coordination detected (T+28-42h) - 2 events
-    events.append({
-        "hours_offset": 32,
-        "data": {
-            "event_type": "narrative_coordination",
-            "summary": "Strong coordination spike with separatist forces warnings",
-            "confidence": 70,
-            "source_ids": [28, 29, 30, 31],
-            "coordination_score": 62,
-            "outlet_count": 3,
-            "synchronized_phrases": ["separatist forces", "national unity", "resolve unshakeable"],
-            "geographic_focus": "Taiwan Strait",
-            "themes": ["sovereignty", "reunification", "anti-separatism"],
-            "article_ids": [28, 29, 30, 31],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=32)).isoformat(),
-        }
-    })
+    Args:
+        path: Fixture file path
+        mode: "rb" or "wb"
 
-    events.append({
-        "hours_offset": 40,
-        "data": {
-            "event_type": "narrative_coordination",
-            "summary": "Military tone emerging with reunification timeline acceleration",
-            "confidence": 72,
-            "source_ids": [35, 36, 37, 38],
-            "coordination_score": 68,
-            "outlet_count": 3,
-            "synchronized_phrases": ["reunification timeline", "not sole option", "foreign interference"],
-            "geographic_focus": "Taiwan Strait",
-            "themes": ["sovereignty", "military", "reunification"],
-            "article_ids": [35, 36, 37, 38],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=40)).isoformat(),
-        }
-    })
+    Returns:
+        Buffered binary file object
+    """
+    if mode == "wb":
+        if path.suffix != ".gz":
+            return open(path, mode, buffering=WRITE_BUFFER_SIZE)
+        return io.BufferedWriter(gzip.open(path, mode, compresslevel=GZIP_LEVEL), WRITE_BUFFER_SIZE)
 
-    # Beat 4: Movement confirmed (T+42-56h) - 2 events
-    events.append({
-        "hours_offset": 48,
-        "data": {
-            "event_type": "narrative_coordination",
-            "summary": "Full-spectrum military readiness messaging across all outlets",
-            "confidence": 82,
-            "source_ids": [41, 42, 43, 44],
-            "coordination_score": 75,
-            "outlet_count": 4,
-            "synchronized_phrases": ["live-fire exercises", "combat readiness", "safeguard sovereignty"],
-            "geographic_focus": "Taiwan Strait",
-            "themes": ["military", "exercises", "readiness"],
-            "article_ids": [41, 42, 43, 44],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=48)).isoformat(),
-        }
-    })
+    with open(path, mode) as f:
+        compressed = f.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    if not compressed:
+        return open(path, mode, buffering=WRITE_BUFFER_SIZE)
+    return io.BufferedReader(gzip.open(path, mode), WRITE_BUFFER_SIZE)
 
-    events.append({
-        "hours_offset": 54,
-        "data": {
-            "event_type": "narrative_coordination",
-            "summary": "Coordinated military operations announcement with decisive action framing",
-            "confidence": 85,
-            "source_ids": [45, 46, 47, 48],
-            "coordination_score": 80,
-            "outlet_count": 4,
-            "synchronized_phrases": ["joint military operations", "decisive action", "high combat readiness"],
-            "geographic_focus": "Taiwan Strait",
-            "themes": ["military", "exercises", "operations"],
-            "article_ids": [45, 46, 47, 48],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=54)).isoformat(),
-        }
-    })
 
-    # Beat 5: Full alert (T+56-72h) - 2 events
-    events.append({
-        "hours_offset": 60,
-        "data": {
-            "event_type": "narrative_coordination",
-            "summary": "Maximum coordination: blockade and encirclement capabilities showcased",
-            "confidence": 90,
-            "source_ids": [52, 53, 54, 55],
-            "coordination_score": 88,
-            "outlet_count": 4,
-            "synchronized_phrases": ["blockade capability", "encirclement", "prepared for decisive action"],
-            "geographic_focus": "Taiwan Strait",
-            "themes": ["military", "operations", "decisive_action"],
-            "article_ids": [52, 53, 54, 55],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=60)).isoformat(),
-        }
-    })
+def write_fixture(fixture: dict, path: Path, pretty: bool = False) -> None:
+    """Stream fixture to disk one record per line.
 
-    events.append({
-        "hours_offset": 68,
-        "data": {
-            "event_type": "narrative_coordination",
-            "summary": "Peak coordination: imminent action framing across all state media",
-            "confidence": 92,
-            "source_ids": [56, 57, 58, 59, 60],
-            "coordination_score": 93,
-            "outlet_count": 4,
-            "synchronized_phrases": ["forces prepared", "highest alert status", "seize control by force"],
-            "geographic_focus": "Taiwan Strait",
-            "themes": ["military", "decisive_action", "readiness"],
-            "article_ids": [56, 57, 58, 59, 60],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=68)).isoformat(),
-        }
-    })
+    Records are serialized compactly and written individually through a large
+    buffered writer, so the whole document is never held in memory as a single
+    string. Output is still one valid JSON object with "metadata" and "records"
+    keys.
 
-    return events
+    Args:
+        fixture: Complete fixture dict (may contain raw datetime values)
+        path: Output file path
+        pretty: Write the whole document indented instead (for debugging)
+    """
+    with _open_fixture(path, "wb") as f:
+        if pretty:
+            f.write(_dumps(fixture, pretty=True))
+            f.write(b"\n")
+            return
 
+        f.write(b'{"metadata":')
+        f.write(_dumps(fixture["metadata"]))
+        f.write(b',\n"records":[\n')
+        for idx, record in enumerate(fixture["records"]):
+            if idx:
+                f.write(b",\n")
+            f.write(_dumps(record))
+        f.write(b"\n]}\n")
 
-def generate_movement_events() -> list[dict]:
-    """Generate pre-computed movement events following 5-beat arc.
+
+def fixture_cache_path(seed: int = FIXTURE_SEED) -> Path:
+    """Locate the cached fixture build for the current sources and seed.
+
+    Apart from metadata.generated_at (restamped on every cache hit, see
+    restore_cached_fixture()), the fixture is a pure function of the generator
+    sources and the RNG seed, so a hash of those identifies a build exactly.
+    Any edit to either script changes the key and forces a rebuild.
+
+    Args:
+        seed: RNG seed the fixture is generated with
 
     Returns:
-        List of movement event records with demo metadata
+        Path of the cache file in FIXTURE_CACHE_DIR (may not exist)
     """
-    events = []
+    digest = hashlib.blake2b(str(seed).encode(), digest_size=8)
+    for source in FIXTURE_SOURCES:
+        digest.update(source.read_bytes())
+    return FIXTURE_CACHE_DIR / f"dragon_fixture_{digest.hexdigest()}.json"
 
-    # Beat 1: Baseline (T+0-14h) - 2 events
-    events.append({
-        "hours_offset": 8,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": None,
-            "location_lat": 24.5,
-            "location_lon": 120.0,
-            "description": "Routine coast guard patrol observed in Taiwan Strait",
-            "category": "naval",
-            "location_name": "Taiwan Strait",
-            "confidence": 30,
-            "source_post_ids": [5, 6],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=8)).isoformat(),
-        }
-    })
 
-    events.append({
-        "hours_offset": 14,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": None,
-            "location_lat": 24.8,
-            "location_lon": 119.5,
-            "description": "Standard naval patrol near Fujian coast",
-            "category": "naval",
-            "location_name": "Taiwan Strait",
-            "confidence": 28,
-            "source_post_ids": [12, 13],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=14)).isoformat(),
-        }
-    })
+def restore_cached_fixture(cache_path: Path, path: Path) -> None:
+    """Copy a cached build to path with a fresh metadata.generated_at.
 
-    # Beat 2: First signals (T+14-28h) - 3 events
-    events.append({
-        "hours_offset": 20,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": 412100005,
-            "location_lat": 24.2,
-            "location_lon": 119.8,
-            "description": "Multiple naval vessels departing Ningbo port",
-            "category": "naval",
-            "location_name": "Taiwan Strait",
-            "confidence": 55,
-            "source_post_ids": [42, 43],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=20)).isoformat(),
-        }
-    })
+    Cached builds are compact write_fixture() output, so only the metadata
+    line is re-serialized; the record lines are copied through unchanged.
 
-    events.append({
-        "hours_offset": 24,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": None,
-            "location_lat": 24.6,
-            "location_lon": 119.3,
-            "description": "Military convoy activity increased near Xiamen",
-            "category": "convoy",
-            "location_name": "Taiwan Strait",
-            "confidence": 52,
-            "source_post_ids": [48, 49, 50],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=24)).isoformat(),
-        }
-    })
+    Args:
+        cache_path: Cached fixture build
+        path: Output file path
+    """
+    loads = orjson.loads if orjson is not None else json.loads
 
-    events.append({
-        "hours_offset": 28,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": 412100008,
-            "location_lat": 25.1,
-            "location_lon": 120.2,
-            "description": "Type 052D destroyers concentrated south of Wenzhou",
-            "category": "naval",
-            "location_name": "Taiwan Strait",
-            "confidence": 58,
-            "source_post_ids": [52, 53],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=28)).isoformat(),
-        }
-    })
+    with open(cache_path, "rb") as src, _open_fixture(path, "wb") as dst:
+        header = src.readline()
+        metadata = loads(header[len(b'{"metadata":'):].rstrip().rstrip(b","))
+        metadata["generated_at"] = datetime.now(timezone.utc).isoformat()
+        dst.write(b'{"metadata":')
+        dst.write(_dumps(metadata))
+        dst.write(b",\n")
+        shutil.copyfileobj(src, dst, WRITE_BUFFER_SIZE)
 
-    # Beat 3: Coordination detected (T+28-42h) - 3 events
-    events.append({
-        "hours_offset": 34,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": None,
-            "location_lat": 24.3,
-            "location_lon": 119.6,
-            "description": "Amphibious ships loading at Zhanjiang, unusual activity level",
-            "category": "convoy",
-            "location_name": "Taiwan Strait",
-            "confidence": 68,
-            "source_post_ids": [60, 61, 62],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=34)).isoformat(),
-        }
-    })
 
-    events.append({
-        "hours_offset": 38,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": None,
-            "location_lat": 24.9,
-            "location_lon": 120.1,
-            "description": "NOTAM issued for restricted airspace over Taiwan Strait",
-            "category": "restricted_zone",
-            "location_name": "Taiwan Strait",
-            "confidence": 72,
-            "source_post_ids": [66, 67],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=38)).isoformat(),
-        }
-    })
+def write_fixture_msgpack(fixture: dict, path: Path) -> None:
+    """Write fixture as a single MessagePack document.
 
-    events.append({
-        "hours_offset": 42,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": 412100015,
-            "location_lat": 25.2,
-            "location_lon": 119.7,
-            "description": "Naval aviation base showing increased sortie rates",
-            "category": "flight",
-            "location_name": "Taiwan Strait",
-            "confidence": 70,
-            "source_post_ids": [70, 71, 72],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=42)).isoformat(),
-        }
-    })
+    Datetimes are packed as native MessagePack timestamps, so no ISO string
+    formatting or parsing happens on either side.
 
-    # Beat 4: Movement confirmed (T+42-56h) - 4 events
-    events.append({
-        "hours_offset": 46,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": 412100018,
-            "location_lat": 24.4,
-            "location_lon": 119.9,
-            "description": "Large-scale PLA exercise announced, live-fire zones declared",
-            "category": "naval",
-            "location_name": "Taiwan Strait",
-            "confidence": 82,
-            "source_post_ids": [82, 83, 84],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=46)).isoformat(),
-        }
-    })
+    Args:
+        fixture: Complete fixture dict (may contain raw datetime values)
+        path: Output file path
+    """
+    with _open_fixture(path, "wb") as f:
+        f.write(msgpack.packb(fixture, datetime=True))
 
-    events.append({
-        "hours_offset": 50,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": None,
-            "location_lat": 24.7,
-            "location_lon": 120.3,
-            "description": "Multiple amphibious assault ships departing Zhanjiang",
-            "category": "convoy",
-            "location_name": "Taiwan Strait",
-            "confidence": 85,
-            "source_post_ids": [88, 89, 90],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=50)).isoformat(),
-        }
-    })
 
-    events.append({
-        "hours_offset": 54,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": None,
-            "location_lat": 24.1,
-            "location_lon": 119.4,
-            "description": "Combat aircraft sorties increased 300% past 12 hours",
-            "category": "flight",
-            "location_name": "Taiwan Strait",
-            "confidence": 88,
-            "source_post_ids": [94, 95, 96],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=54)).isoformat(),
+def read_fixture(path: Path) -> dict:
+    """Load fixture from disk, using orjson when installed.
+
+    JSON timestamps come back as ISO 8601 strings; consumers that need
+    datetimes should parse them with datetime.fromisoformat rather than
+    strptime. ".msgpack" files are decoded with native datetimes.
+
+    Args:
+        path: Fixture file path
+
+    Returns:
+        Parsed fixture dict
+    """
+    with _open_fixture(path, "rb") as f:
+        data = f.read()
+    if ".msgpack" in path.suffixes:
+        return msgpack.unpackb(data, timestamp=3)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_fixture(path: Path) -> dict:
+    """Open a fixture for a single streaming pass over its records.
+
+    Files written by write_fixture() hold one record per line, so records are
+    parsed one at a time and never held in memory together. Any other layout
+    (e.g. --pretty output) falls back to read_fixture().
+
+    Args:
+        path: Fixture file path
+
+    Returns:
+        Fixture dict whose "records" value is an iterator of record dicts;
+        the iterator raises ValueError if the file ends before the closing
+        "]}" line (a truncated fixture)
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+
+    with _open_fixture(path, "rb") as f:
+        header = f.readline()
+    if not (header.startswith(b'{"metadata":') and header.rstrip().endswith(b",")):
+        fixture = read_fixture(path)
+        return {"metadata": fixture.get("metadata", {}), "records": iter(fixture.get("records", []))}
+
+    def records():
+        with _open_fixture(path, "rb") as f:
+            f.readline()  # metadata
+            f.readline()  # "records":[
+            for line in f:
+                line = line.rstrip().rstrip(b",")
+                if line == b"]}":
+                    return
+                yield loads(line)
+        raise ValueError("Fixture is truncated: records array is not closed")
+
+    return {"metadata": loads(header[len(b'{"metadata":'):].rstrip().rstrip(b",")), "records": records()}
+
+
+@dataclass(slots=True, frozen=True)
+class NarrativeEvent:
+    """Pre-computed narrative event at a fixed point in the scenario."""
+
+    hours_offset: int
+    summary: str
+    confidence: int
+    coordination_score: int
+    outlet_count: int
+    synchronized_phrases: tuple[str, ...]
+    themes: tuple[str, ...]
+    article_ids: tuple[int, ...]
+
+    def to_record(self) -> dict:
+        """Convert to the fixture's {"hours_offset", "data"} record shape.
+
+        Returns:
+            Narrative event record with demo metadata
+        """
+        return {
+            "hours_offset": self.hours_offset,
+            "data": {
+                "event_type": NARRATIVE_EVENT_TYPE,
+                "summary": self.summary,
+                "confidence": self.confidence,
+                "source_ids": self.article_ids,
+                "coordination_score": self.coordination_score,
+                "outlet_count": self.outlet_count,
+                "synchronized_phrases": self.synchronized_phrases,
+                "geographic_focus": REGION,
+                "themes": self.themes,
+                "article_ids": self.article_ids,
+                "created_at": TIME_AT[self.hours_offset],
+            }
         }
-    })
 
-    events.append({
-        "hours_offset": 56,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": None,
-            "location_lat": 25.0,
-            "location_lon": 120.0,
-            "description": "Six no-sail zones declared surrounding Taiwan",
-            "category": "restricted_zone",
-            "location_name": "Taiwan Strait",
-            "confidence": 90,
-            "source_post_ids": [98, 99, 100],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=56)).isoformat(),
+
+@dataclass(slots=True, frozen=True)
+class MovementEvent:
+    """Pre-computed movement event at a fixed point in the scenario."""
+
+    hours_offset: int
+    description: str
+    category: str
+    location_lat: float
+    location_lon: float
+    confidence: int
+    vessel_mmsi: int | None
+    source_post_ids: tuple[int, ...]
+
+    def to_record(self) -> dict:
+        """Convert to the fixture's {"hours_offset", "data"} record shape.
+
+        Returns:
+            Movement event record with demo metadata
+        """
+        return {
+            "hours_offset": self.hours_offset,
+            "data": {
+                "event_type": MOVEMENT_EVENT_TYPE,
+                "vessel_mmsi": self.vessel_mmsi,
+                "location_lat": self.location_lat,
+                "location_lon": self.location_lon,
+                "description": self.description,
+                "category": self.category,
+                "location_name": REGION,
+                "confidence": self.confidence,
+                "source_post_ids": self.source_post_ids,
+                "created_at": TIME_AT[self.hours_offset],
+            }
         }
-    })
 
+
+# Narrative events held as slotted instances and only expanded into dicts at
+# the fixture boundary. Sequences are immutable tuples referenced directly by
+# the records; source_ids and article_ids share the same tuple.
+NARRATIVE_EVENTS = (
+    # Beat 1: Baseline (T+0-14h) - 1 event
+    NarrativeEvent(12, "Routine cross-strait coverage with peaceful development themes", 35, 12, 2,
+                   ("peaceful development", "cross-strait cooperation"),
+                   ("cooperation",), (1, 2, 3, 4)),
+    # Beat 2: First signals (T+14-28h) - 2 events
+    NarrativeEvent(18, "Increased sovereignty messaging across multiple state outlets", 55, 35, 2,
+                   ("sovereignty non-negotiable", "territorial integrity"),
+                   ("sovereignty",), (21, 22, 23)),
+    NarrativeEvent(26, "Reunification messaging with coordinated phrasing", 60, 42, 3,
+                   ("reunification inevitable", "historical responsibility"),
+                   ("sovereignty", "reunification"), (24, 25, 26, 27)),
+    # Beat 3: Coordination detected (T+28-42h) - 2 events
+    NarrativeEvent(32, "Strong coordination spike with separatist forces warnings", 70, 62, 3,
+                   ("separatist forces", "national unity", "resolve unshakeable"),
+                   ("sovereignty", "reunification", "anti-separatism"), (28, 29, 30, 31)),
+    NarrativeEvent(40, "Military tone emerging with reunification timeline acceleration", 72, 68, 3,
+                   ("reunification timeline", "not sole option", "foreign interference"),
+                   ("sovereignty", "military", "reunification"), (35, 36, 37, 38)),
+    # Beat 4: Movement confirmed (T+42-56h) - 2 events
+    NarrativeEvent(48, "Full-spectrum military readiness messaging across all outlets", 82, 75, 4,
+                   ("live-fire exercises", "combat readiness", "safeguard sovereignty"),
+                   ("military", "exercises", "readiness"), (41, 42, 43, 44)),
+    NarrativeEvent(54, "Coordinated military operations announcement with decisive action framing", 85, 80, 4,
+                   ("joint military operations", "decisive action", "high combat readiness"),
+                   ("military", "exercises", "operations"), (45, 46, 47, 48)),
+    # Beat 5: Full alert (T+56-72h) - 2 events
+    NarrativeEvent(60, "Maximum coordination: blockade and encirclement capabilities showcased", 90, 88, 4,
+                   ("blockade capability", "encirclement", "prepared for decisive action"),
+                   ("military", "operations", "decisive_action"), (52, 53, 54, 55)),
+    NarrativeEvent(68, "Peak coordination: imminent action framing across all state media", 92, 93, 4,
+                   ("forces prepared", "highest alert status", "seize control by force"),
+                   ("military", "decisive_action", "readiness"), (56, 57, 58, 59, 60)),
+)
+
+# Movement events, same layout as NARRATIVE_EVENTS
+MOVEMENT_EVENTS = (
+    # Beat 1: Baseline (T+0-14h) - 2 events
+    MovementEvent(8, "Routine coast guard patrol observed in Taiwan Strait",
+                  "naval", 24.5, 120.0, 30, None, (5, 6)),
+    MovementEvent(14, "Standard naval patrol near Fujian coast",
+                  "naval", 24.8, 119.5, 28, None, (12, 13)),
+    # Beat 2: First signals (T+14-28h) - 3 events
+    MovementEvent(20, "Multiple naval vessels departing Ningbo port",
+                  "naval", 24.2, 119.8, 55, 412100005, (42, 43)),
+    MovementEvent(24, "Military convoy activity increased near Xiamen",
+                  "convoy", 24.6, 119.3, 52, None, (48, 49, 50)),
+    MovementEvent(28, "Type 052D destroyers concentrated south of Wenzhou",
+                  "naval", 25.1, 120.2, 58, 412100008, (52, 53)),
+    # Beat 3: Coordination detected (T+28-42h) - 3 events
+    MovementEvent(34, "Amphibious ships loading at Zhanjiang, unusual activity level",
+                  "convoy", 24.3, 119.6, 68, None, (60, 61, 62)),
+    MovementEvent(38, "NOTAM issued for restricted airspace over Taiwan Strait",
+                  "restricted_zone", 24.9, 120.1, 72, None, (66, 67)),
+    MovementEvent(42, "Naval aviation base showing increased sortie rates",
+                  "flight", 25.2, 119.7, 70, 412100015, (70, 71, 72)),
+    # Beat 4: Movement confirmed (T+42-56h) - 4 events
+    MovementEvent(46, "Large-scale PLA exercise announced, live-fire zones declared",
+                  "naval", 24.4, 119.9, 82, 412100018, (82, 83, 84)),
+    MovementEvent(50, "Multiple amphibious assault ships departing Zhanjiang",
+                  "convoy", 24.7, 120.3, 85, None, (88, 89, 90)),
+    MovementEvent(54, "Combat aircraft sorties increased 300% past 12 hours",
+                  "flight", 24.1, 119.4, 88, None, (94, 95, 96)),
+    MovementEvent(56, "Six no-sail zones declared surrounding Taiwan",
+                  "restricted_zone", 25.0, 120.0, 90, None, (98, 99, 100)),
     # Beat 5: Full alert (T+56-72h) - 3 events
-    events.append({
-        "hours_offset": 62,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": 412100025,
-            "location_lat": 24.5,
-            "location_lon": 119.8,
-            "description": "Naval blockade formation visible, at least 20 major combatants",
-            "category": "naval",
-            "location_name": "Taiwan Strait",
-            "confidence": 92,
-            "source_post_ids": [105, 106, 107, 108],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=62)).isoformat(),
-        }
-    })
+    MovementEvent(62, "Naval blockade formation visible, at least 20 major combatants",
+                  "naval", 24.5, 119.8, 92, 412100025, (105, 106, 107, 108)),
+    MovementEvent(66, "Rocket Force TELs moving to coastal launch positions",
+                  "convoy", 24.8, 120.1, 90, None, (112, 113, 114)),
+    MovementEvent(70, "Amphibious assault wave launched, landing craft in water",
+                  "convoy", 24.3, 119.5, 95, None, (118, 119, 120)),
+)
 
-    events.append({
-        "hours_offset": 66,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": None,
-            "location_lat": 24.8,
-            "location_lon": 120.1,
-            "description": "Rocket Force TELs moving to coastal launch positions",
-            "category": "convoy",
-            "location_name": "Taiwan Strait",
-            "confidence": 90,
-            "source_post_ids": [112, 113, 114],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=66)).isoformat(),
-        }
-    })
 
-    events.append({
-        "hours_offset": 70,
-        "data": {
-            "event_type": "military_movement",
-            "vessel_mmsi": None,
-            "location_lat": 24.3,
-            "location_lon": 119.5,
-            "description": "Amphibious assault wave launched, landing craft in water",
-            "category": "convoy",
-            "location_name": "Taiwan Strait",
-            "confidence": 95,
-            "source_post_ids": [118, 119, 120],
-            "created_at": (FIXTURE_BASE_TIME + timedelta(hours=70)).isoformat(),
-        }
-    })
+def _build_narrative_events() -> list[dict]:
+    """Generate pre-computed narrative events following 5-beat arc.
+
+    Returns:
+        List of narrative event records with demo metadata
+    """
+    return [event.to_record() for event in NARRATIVE_EVENTS]
 
-    return events
 
+def _build_movement_events() -> list[dict]:
+    """Generate pre-computed movement events following 5-beat arc.
+
+    Returns:
+        List of movement event records with demo metadata
+    """
+    return [event.to_record() for event in MOVEMENT_EVENTS]
 
-def generate_alerts() -> list[dict]:
+
+def _build_alerts() -> list[dict]:
     """Generate pre-computed alert updates following 5-beat escalation.
 
+    detection_history is built up incrementally: each beat appends its own
+    entry and snapshots the running list, so earlier beats are not repeated.
+
     Returns:
         List of alert records with demo metadata (first INSERT, rest UPDATEs)
     """
-    alerts = []
-
-    # Beat 1: Initial GREEN alert (INSERT)
-    alerts.append({
-        "hours_offset": 14,
-        "action": "insert",
-        "data": {
-            "region": "Taiwan Strait",
+    beats = [
+        # Beat 1: Initial GREEN alert (INSERT)
+        {
+            "hours_offset": 14,
             "threat_level": "GREEN",
             "threat_score": 12,
             "confidence": 30,
             "severity": "low",
             "title": "Baseline Activity",
             "description": "Normal cross-strait patterns observed",
-            "event_ids": [],
             "sub_scores": {
                 "outlet_score": 15,
                 "phrase_score": 10,
                 "volume_score": 8,
                 "geo_score": 15
             },
-            "correlation_metadata": {
-                "narrative_event_ids": [1],
-                "movement_event_ids": [1, 2],
-                "evidence_summary": "Routine coverage and standard naval patrols",
-                "detection_history": [
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=14)).isoformat(),
-                        "score": 12,
-                        "level": "GREEN"
-                    }
-                ]
-            },
-            "updated_at": (FIXTURE_BASE_TIME + timedelta(hours=14)).isoformat(),
-        }
-    })
-
-    # Beat 2: First elevation to GREEN with higher score (UPDATE)
-    alerts.append({
-        "hours_offset": 28,
-        "action": "update",
-        "data": {
-            "region": "Taiwan Strait",
+            "narrative_event_ids": [1],
+            "movement_event_ids": [1, 2],
+            "evidence_summary": "Routine coverage and standard naval patrols",
+        },
+        # Beat 2: First elevation to GREEN with higher score (UPDATE)
+        {
+            "hours_offset": 28,
             "threat_level": "GREEN",
             "threat_score": 28,
             "confidence": 52,
             "severity": "low",
             "title": "Increased Rhetoric",
             "description": "Sovereignty messaging elevated across state outlets",
-            "event_ids": [],
             "sub_scores": {
                 "outlet_score": 32,
                 "phrase_score": 28,
                 "volume_score": 22,
                 "geo_score": 30
             },
-            "correlation_metadata": {
-                "narrative_event_ids": [1, 2, 3],
-                "movement_event_ids": [1, 2, 3, 4, 5],
-                "evidence_summary": "Coordinated sovereignty messaging with increased naval activity",
-                "detection_history": [
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=14)).isoformat(),
-                        "score": 12,
-                        "level": "GREEN"
-                    },
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=28)).isoformat(),
-                        "score": 28,
-                        "level": "GREEN"
-                    }
-                ]
-            },
-            "updated_at": (FIXTURE_BASE_TIME + timedelta(hours=28)).isoformat(),
-        }
-    })
-
-    # Beat 3: Escalation to AMBER (UPDATE)
-    alerts.append({
-        "hours_offset": 42,
-        "action": "update",
-        "data": {
-            "region": "Taiwan Strait",
+            "narrative_event_ids": [1, 2, 3],
+            "movement_event_ids": [1, 2, 3, 4, 5],
+            "evidence_summary": "Coordinated sovereignty messaging with increased naval activity",
+        },
+        # Beat 3: Escalation to AMBER (UPDATE)
+        {
+            "hours_offset": 42,
             "threat_level": "AMBER",
             "threat_score": 52,
             "confidence": 71,
             "severity": "medium",
             "title": "Coordination Detected",
             "description": "Significant narrative coordination aligned with military movements",
-            "event_ids": [],
             "sub_scores": {
                 "outlet_score": 58,
                 "phrase_score": 52,
                 "volume_score": 45,
                 "geo_score": 55
             },
-            "correlation_metadata": {
-                "narrative_event_ids": [1, 2, 3, 4, 5],
-                "movement_event_ids": [1, 2, 3, 4, 5, 6, 7, 8],
-                "evidence_summary": "Strong narrative coordination spike with amphibious ship loading and restricted airspace",
-                "detection_history": [
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=14)).isoformat(),
-                        "score": 12,
-                        "level": "GREEN"
-                    },
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=28)).isoformat(),
-                        "score": 28,
-                        "level": "GREEN"
-                    },
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=42)).isoformat(),
-                        "score": 52,
-                        "level": "AMBER"
-                    }
-                ]
-            },
-            "updated_at": (FIXTURE_BASE_TIME + timedelta(hours=42)).isoformat(),
-        }
-    })
-
-    # Beat 4: Higher AMBER (UPDATE)
-    alerts.append({
-        "hours_offset": 56,
-        "action": "update",
-        "data": {
-            "region": "Taiwan Strait",
+            "narrative_event_ids": [1, 2, 3, 4, 5],
+            "movement_event_ids": [1, 2, 3, 4, 5, 6, 7, 8],
+            "evidence_summary": "Strong narrative coordination spike with amphibious ship loading and restricted airspace",
+        },
+        # Beat 4: Higher AMBER (UPDATE)
+        {
+            "hours_offset": 56,
             "threat_level": "AMBER",
             "threat_score": 68,
             "confidence": 84,
             "severity": "high",
             "title": "Movement Confirmed",
             "description": "Military readiness messaging synchronized with live-fire exercise announcement",
-            "event_ids": [],
             "sub_scores": {
                 "outlet_score": 72,
                 "phrase_score": 68,
                 "volume_score": 62,
                 "geo_score": 70
             },
-            "correlation_metadata": {
-                "narrative_event_ids": [1, 2, 3, 4, 5, 6, 7],
-                "movement_event_ids": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
-                "evidence_summary": "Full military readiness narrative with large-scale exercise and no-sail zones declared",
-                "detection_history": [
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=14)).isoformat(),
-                        "score": 12,
-                        "level": "GREEN"
-                    },
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=28)).isoformat(),
-                        "score": 28,
-                        "level": "GREEN"
-                    },
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=42)).isoformat(),
-                        "score": 52,
-                        "level": "AMBER"
-                    },
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=56)).isoformat(),
-                        "score": 68,
-                        "level": "AMBER"
-                    }
-                ]
-            },
-            "updated_at": (FIXTURE_BASE_TIME + timedelta(hours=56)).isoformat(),
-        }
-    })
-
-    # Beat 5: Escalation to RED (UPDATE)
-    alerts.append({
-        "hours_offset": 70,
-        "action": "update",
-        "data": {
-            "region": "Taiwan Strait",
+            "narrative_event_ids": [1, 2, 3, 4, 5, 6, 7],
+            "movement_event_ids": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
+            "evidence_summary": "Full military readiness narrative with large-scale exercise and no-sail zones declared",
+        },
+        # Beat 5: Escalation to RED (UPDATE)
+        {
+            "hours_offset": 70,
             "threat_level": "RED",
             "threat_score": 82,
             "confidence": 92,
             "severity": "critical",
             "title": "Full Alert",
             "description": "Peak coordination with naval blockade and amphibious assault operations",
-            "event_ids": [],
             "sub_scores": {
                 "outlet_score": 88,
                 "phrase_score": 82,
                 "volume_score": 78,
                 "geo_score": 85
             },
-            "correlation_metadata": {
-                "narrative_event_ids": [1, 2, 3, 4, 5, 6, 7, 8, 9],
-                "movement_event_ids": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
-                "evidence_summary": "Maximum narrative coordination with imminent action framing and amphibious assault wave launched",
-                "detection_history": [
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=14)).isoformat(),
-                        "score": 12,
-                        "level": "GREEN"
-                    },
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=28)).isoformat(),
-                        "score": 28,
-                        "level": "GREEN"
-                    },
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=42)).isoformat(),
-                        "score": 52,
-                        "level": "AMBER"
-                    },
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=56)).isoformat(),
-                        "score": 68,
-                        "level": "AMBER"
-                    },
-                    {
-                        "detected_at": (FIXTURE_BASE_TIME + timedelta(hours=70)).isoformat(),
-                        "score": 82,
-                        "level": "RED"
-                    }
-                ]
-            },
-            "updated_at": (FIXTURE_BASE_TIME + timedelta(hours=70)).isoformat(),
-        }
-    })
+            "narrative_event_ids": [1, 2, 3, 4, 5, 6, 7, 8, 9],
+            "movement_event_ids": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
+            "evidence_summary": "Maximum narrative coordination with imminent action framing and amphibious assault wave launched",
+        },
+    ]
+
+    alerts = []
+    detection_history = []
+
+    for beat in beats:
+        hours = beat["hours_offset"]
+        detection_history.append({
+            "detected_at": TIME_AT[hours],
+            "score": beat["threat_score"],
+            "level": beat["threat_level"]
+        })
+
+        alerts.append({
+            "hours_offset": hours,
+            "action": "update" if alerts else "insert",
+            "data": {
+                "region": REGION,
+                "threat_level": beat["threat_level"],
+                "threat_score": beat["threat_score"],
+                "confidence": beat["confidence"],
+                "severity": beat["severity"],
+                "title": beat["title"],
+                "description": beat["description"],
+                "event_ids": [],
+                "sub_scores": beat["sub_scores"],
+                "correlation_metadata": {
+                    "narrative_event_ids": beat["narrative_event_ids"],
+                    "movement_event_ids": beat["movement_event_ids"],
+                    "evidence_summary": beat["evidence_summary"],
+                    "detection_history": detection_history.copy()
+                },
+                "updated_at": TIME_AT[hours],
+            }
+        })
 
     return alerts
 
 
-def generate_briefs() -> list[dict]:
+def _build_briefs() -> list[dict]:
     """Generate pre-computed intelligence briefs at key escalation moments.
 
     Returns:
@@ -781,7 +691,7 @@ def generate_briefs() -> list[dict]:
             ],
             "narrative_event_ids": [1, 2, 3],
             "movement_event_ids": [1, 2, 3, 4, 5],
-            "generated_at": (FIXTURE_BASE_TIME + timedelta(hours=29)).isoformat(),
+            "generated_at": TIME_AT[29],
         }
     })
 
@@ -821,7 +731,7 @@ def generate_briefs() -> list[dict]:
             ],
             "narrative_event_ids": [1, 2, 3, 4, 5, 6, 7],
             "movement_event_ids": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
-            "generated_at": (FIXTURE_BASE_TIME + timedelta(hours=48)).isoformat(),
+            "generated_at": TIME_AT[48],
         }
     })
 
@@ -862,22 +772,86 @@ def generate_briefs() -> list[dict]:
             ],
             "narrative_event_ids": [1, 2, 3, 4, 5, 6, 7, 8, 9],
             "movement_event_ids": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
-            "generated_at": (FIXTURE_BASE_TIME + timedelta(hours=68)).isoformat(),
+            "generated_at": TIME_AT[68],
         }
     })
 
     return briefs
 
 
-def generate_fixture() -> dict:
+# Scenario outputs are pure functions of the constants above, so build them
+# once at import and share them across generate/validate runs in a process
+NARRATIVE_EVENT_RECORDS = _build_narrative_events()
+MOVEMENT_EVENT_RECORDS = _build_movement_events()
+ALERTS = _build_alerts()
+BRIEFS = _build_briefs()
+
+
+def _timed_records(table: str, rows: list[dict], time_key: str) -> list[dict]:
+    """Wrap raw rows as insert records offset by their own timestamps.
+
+    Timestamps are mapped straight from epoch seconds to demo seconds with a
+    single multiply, skipping the datetime subtraction and hour conversion
+    per row.
+
+    Args:
+        table: Target table name
+        rows: Raw data rows (tz-aware datetimes under time_key)
+        time_key: Name of the row's timestamp field
+
+    Returns:
+        List of fixture records in input order
+    """
+    scale = DEMO_SECONDS_PER_SCENARIO_SECOND
+    offsets = add_jitter_many([(row[time_key].timestamp() - BASE_TS) * scale for row in rows])
+    return [
+        {
+            "_table": table,
+            "_demo_offset_seconds": round(offset, 3),
+            "_demo_action": "insert",
+            "data": row
+        }
+        for row, offset in zip(rows, offsets)
+    ]
+
+
+def _scheduled_records(table: str, items: list[dict]) -> list[dict]:
+    """Wrap pre-computed scenario items as fixture records.
+
+    Args:
+        table: Target table name
+        items: Items with "hours_offset", "data" and optional "action" keys
+
+    Returns:
+        List of fixture records in input order
+    """
+    offsets = add_jitter_many([hours_to_demo_offset(item["hours_offset"]) for item in items])
+    return [
+        {
+            "_table": table,
+            "_demo_offset_seconds": round(offset, 3),
+            "_demo_action": item.get("action", "insert"),
+            "data": item["data"]
+        }
+        for item, offset in zip(items, offsets)
+    ]
+
+
+def generate_fixture(seed: int = FIXTURE_SEED) -> dict:
     """Generate complete demo fixture with all table types.
 
+    Args:
+        seed: RNG seed applied once before any data is generated
+
     Returns:
-        Complete fixture dict ready for JSON serialization
+        Complete fixture dict ready for write_fixture() (datetimes left as-is)
     """
     print("Generating demo fixture...")
     print()
 
+    # Seed once so jitter is reproducible (raw-data generators seed their own RNGs)
+    random.seed(seed)
+
     # Generate raw intelligence data (Phase 1)
     print("Generating Phase 1 raw intelligence...")
     articles = generate_demo_articles(FIXTURE_BASE_TIME, count=60)
@@ -888,113 +862,47 @@ def generate_fixture() -> dict:
     print(f"  Vessel positions: {len(positions)}")
     print()
 
-    # Generate processed intelligence (Phase 2)
+    # Processed intelligence (Phase 2), prebuilt at import
     print("Generating Phase 2 processed intelligence...")
-    narrative_events = generate_narrative_events()
-    movement_events = generate_movement_events()
+    narrative_events = NARRATIVE_EVENT_RECORDS
+    movement_events = MOVEMENT_EVENT_RECORDS
     print(f"  Narrative events: {len(narrative_events)}")
     print(f"  Movement events: {len(movement_events)}")
     print()
 
-    # Generate correlation outputs (Phase 3)
+    # Correlation outputs (Phase 3), prebuilt at import
     print("Generating Phase 3 correlation outputs...")
-    alerts = generate_alerts()
-    briefs = generate_briefs()
+    alerts = ALERTS
+    briefs = BRIEFS
     print(f"  Alerts: {len(alerts)}")
     print(f"  Briefs: {len(briefs)}")
     print()
 
-    # Convert to fixture format with demo timing
-    records = []
-
-    # Add articles
-    for article in articles:
-        hours_offset = (article["published_at"] - FIXTURE_BASE_TIME).total_seconds() / 3600
-        demo_offset = add_jitter(hours_to_demo_offset(hours_offset))
-
-        records.append({
-            "_table": "articles",
-            "_demo_offset_seconds": round(demo_offset, 3),
-            "_demo_action": "insert",
-            "data": convert_datetimes_to_iso(article)
-        })
-
-    # Add social posts
-    for post in posts:
-        hours_offset = (post["timestamp"] - FIXTURE_BASE_TIME).total_seconds() / 3600
-        demo_offset = add_jitter(hours_to_demo_offset(hours_offset))
-
-        records.append({
-            "_table": "social_posts",
-            "_demo_offset_seconds": round(demo_offset, 3),
-            "_demo_action": "insert",
-            "data": convert_datetimes_to_iso(post)
-        })
-
-    # Add vessel positions
-    for position in positions:
-        hours_offset = (position["timestamp"] - FIXTURE_BASE_TIME).total_seconds() / 3600
-        demo_offset = add_jitter(hours_to_demo_offset(hours_offset))
-
-        records.append({
-            "_table": "vessel_positions",
-            "_demo_offset_seconds": round(demo_offset, 3),
-            "_demo_action": "insert",
-            "data": convert_datetimes_to_iso(position)
-        })
-
-    # Add narrative events
-    for event in narrative_events:
-        demo_offset = add_jitter(hours_to_demo_offset(event["hours_offset"]))
-
-        records.append({
-            "_table": "narrative_events",
-            "_demo_offset_seconds": round(demo_offset, 3),
-            "_demo_action": "insert",
-            "data": event["data"]
-        })
-
-    # Add movement events
-    for event in movement_events:
-        demo_offset = add_jitter(hours_to_demo_offset(event["hours_offset"]))
-
-        records.append({
-            "_table": "movement_events",
-            "_demo_offset_seconds": round(demo_offset, 3),
-            "_demo_action": "insert",
-            "data": event["data"]
-        })
-
-    # Add alerts
-    for alert in alerts:
-        demo_offset = add_jitter(hours_to_demo_offset(alert["hours_offset"]))
-
-        records.append({
-            "_table": "alerts",
-            "_demo_offset_seconds": round(demo_offset, 3),
-            "_demo_action": alert["action"],
-            "data": alert["data"]
-        })
-
-    # Add briefs
-    for brief in briefs:
-        demo_offset = add_jitter(hours_to_demo_offset(brief["hours_offset"]))
-
-        records.append({
-            "_table": "briefs",
-            "_demo_offset_seconds": round(demo_offset, 3),
-            "_demo_action": "insert",
-            "data": brief["data"]
-        })
-
-    # Sort by demo offset for sequential playback
-    records.sort(key=lambda r: r["_demo_offset_seconds"])
+    # Convert to fixture format with demo timing. One list display sizes the
+    # result once instead of growing it a record at a time.
+    records = [
+        *_timed_records("articles", articles, "published_at"),
+        *_timed_records("social_posts", posts, "timestamp"),
+        *_timed_records("vessel_positions", positions, "timestamp"),
+        *_scheduled_records("narrative_events", narrative_events),
+        *_scheduled_records("movement_events", movement_events),
+        *_scheduled_records("alerts", alerts),
+        *_scheduled_records("briefs", briefs),
+    ]
+
+    # Sort by demo offset for sequential playback. Each table's records are
+    # appended as a nearly-ordered run, which Timsort merges in C; this beats
+    # heapq.merge over per-table streams at this size.
+    records.sort(key=operator.itemgetter("_demo_offset_seconds"))
+
+    # Tag co-submission windows so the playback engine can group consecutive
+    # records into one multi-row insert instead of one round-trip each
+    batch_seconds = BATCH_WINDOW_HOURS * SECONDS_PER_HOUR
+    for record in records:
+        record["_demo_batch"] = int(record["_demo_offset_seconds"] // batch_seconds)
 
     # Count records by table
-    record_counts = {}
-    for record in records:
-        table = record["_table"]
-        record_counts[table] = record_counts.get(table, 0) + 1
+    record_counts = dict(Counter(record["_table"] for record in records))
 
     # Build fixture
     fixture = {
@@ -1019,11 +927,24 @@ def generate_fixture() -> dict:
     return fixture
 
 
+# Required data fields per table, checked against one sample record each
+REQUIRED_FIELDS = {
+    "articles": ("url", "title", "domain", "published_at", "tone_score"),
+    "social_posts": ("telegram_id", "channel", "text", "timestamp", "views"),
+    "vessel_positions": ("mmsi", "ship_name", "latitude", "longitude", "speed", "course", "timestamp"),
+    "narrative_events": ("event_type", "summary", "confidence", "source_ids", "coordination_score", "outlet_count", "synchronized_phrases", "geographic_focus", "themes", "article_ids", "created_at"),
+    "movement_events": ("event_type", "description", "location_lat", "location_lon", "confidence", "category", "location_name", "source_post_ids", "created_at"),
+    "alerts": ("region", "threat_level", "threat_score", "confidence", "sub_scores", "correlation_metadata"),
+    "briefs": ("threat_level", "confidence", "summary", "evidence_chain", "timeline", "collection_priorities", "narrative_event_ids", "movement_event_ids"),
+}
+REQUIRED_FIELD_SETS = {table: frozenset(fields) for table, fields in REQUIRED_FIELDS.items()}
+
+
 def validate_fixture(fixture: dict) -> tuple[bool, list[str]]:
     """Validate fixture data structure and content.
 
     Args:
-        fixture: Complete fixture dict
+        fixture: Fixture dict; "records" may be a list or a one-shot iterator
 
     Returns:
         Tuple of (is_valid, list of error messages)
@@ -1049,22 +970,48 @@ def validate_fixture(fixture: dict) -> tuple[bool, list[str]]:
         errors.append("Missing 'records' key")
         return False, errors
 
-    records = fixture["records"]
-
-    # Validate record structure
+    # Validate record structure. Records are consumed in a single pass (they
+    # may be a stream from iter_fixture()); only the per-table sample record,
+    # the offsets, and the alert records are kept.
     print("Validating record structure...")
     expected_tables = {"articles", "social_posts", "vessel_positions", "narrative_events", "movement_events", "alerts", "briefs"}
-    found_tables = set()
-
-    for idx, record in enumerate(records):
-        # Check required fields
-        for key in ["_table", "_demo_offset_seconds", "_demo_action", "data"]:
-            if key not in record:
-                errors.append(f"Record {idx}: Missing key '{key}'")
-
-        # Collect table types
-        if "_table" in record:
-            found_tables.add(record["_table"])
+    table_counts = Counter()
+    table_samples = {}
+    offsets = []
+    alert_records = []
+    record_count = 0
+
+    # A malformed or truncated stream surfaces as ValueError mid-iteration
+    # (orjson/json decode errors subclass it); keep what was read so far
+    try:
+        for idx, record in enumerate(fixture["records"]):
+            record_count = idx + 1
+
+            # Check required fields
+            for key in ["_table", "_demo_offset_seconds", "_demo_action", "data"]:
+                if key not in record:
+                    errors.append(f"Record {idx}: Missing key '{key}'")
+
+            if "_demo_offset_seconds" in record:
+                offsets.append(record["_demo_offset_seconds"])
+
+            # Collect table types
+            table = record.get("_table")
+            if table is not None:
+                table_counts[table] += 1
+                if table not in table_samples and "data" in record:
+                    table_samples[table] = record["data"]
+                if table == "alerts":
+                    alert_records.append(record)
+    except ValueError as e:
+        errors.append(f"Unreadable records after {record_count} read: {e}")
+
+    # Streamed record count must match the header
+    total_records = metadata.get("total_records")
+    if total_records is not None and record_count != total_records:
+        errors.append(f"Record count mismatch: {record_count} records, metadata says {total_records}")
+
+    found_tables = set(table_counts)
 
     # Check all 7 tables present
     missing_tables = expected_tables - found_tables
@@ -1073,29 +1020,18 @@ def validate_fixture(fixture: dict) -> tuple[bool, list[str]]:
 
     print(f"  Tables found: {len(found_tables)}/7")
     for table in sorted(found_tables):
-        count = sum(1 for r in records if r.get("_table") == table)
-        print(f"    {table}: {count} records")
+        print(f"    {table}: {table_counts[table]} records")
     print()
 
     # Validate required fields per table type
     print("Validating required fields per table...")
-    required_fields = {
-        "articles": ["url", "title", "domain", "published_at", "tone_score"],
-        "social_posts": ["telegram_id", "channel", "text", "timestamp", "views"],
-        "vessel_positions": ["mmsi", "ship_name", "latitude", "longitude", "speed", "course", "timestamp"],
-        "narrative_events": ["event_type", "summary", "confidence", "source_ids", "coordination_score", "outlet_count", "synchronized_phrases", "geographic_focus", "themes", "article_ids", "created_at"],
-        "movement_events": ["event_type", "description", "location_lat", "location_lon", "confidence", "category", "location_name", "source_post_ids", "created_at"],
-        "alerts": ["region", "threat_level", "threat_score", "confidence", "sub_scores", "correlation_metadata"],
-        "briefs": ["threat_level", "confidence", "summary", "evidence_chain", "timeline", "collection_priorities", "narrative_event_ids", "movement_event_ids"]
-    }
-
     field_errors_found = False
-    for table, fields in required_fields.items():
-        table_records = [r for r in records if r.get("_table") == table]
-        if table_records:
-            sample = table_records[0]["data"]
-            missing_fields = [f for f in fields if f not in sample]
-            if missing_fields:
+    for table, fields in REQUIRED_FIELDS.items():
+        sample = table_samples.get(table)
+        if sample is not None:
+            missing = REQUIRED_FIELD_SETS[table] - sample.keys()
+            if missing:
+                missing_fields = [f for f in fields if f in missing]  # Keep declared order
                 errors.append(f"{table}: Missing required fields: {missing_fields}")
                 field_errors_found = True
 
@@ -1103,18 +1039,20 @@ def validate_fixture(fixture: dict) -> tuple[bool, list[str]]:
         print(f"  ✓ All required fields present across table types")
     print()
 
-    # Validate sorting
+    # Validate sorting (pairwise comparison in C, no sorted copy)
     print("Validating timing...")
-    offsets = [r["_demo_offset_seconds"] for r in records if "_demo_offset_seconds" in r]
-    if offsets != sorted(offsets):
+    is_sorted = all(map(operator.le, offsets, offsets[1:]))
+    if not is_sorted:
         errors.append("Records not sorted by _demo_offset_seconds")
     else:
         print(f"  ✓ Records sorted by offset")
 
-    # Check offset range
+    # Check offset range (endpoints when sorted)
     if offsets:
-        min_offset = min(offsets)
-        max_offset = max(offsets)
+        if is_sorted:
+            min_offset, max_offset = offsets[0], offsets[-1]
+        else:
+            min_offset, max_offset = min(offsets), max(offsets)
         if min_offset < 0:
             errors.append(f"Negative offset found: {min_offset}")
         if max_offset > NORMAL_DURATION_SECONDS + 5:  # Allow small buffer
@@ -1123,11 +1061,9 @@ def validate_fixture(fixture: dict) -> tuple[bool, list[str]]:
             print(f"  ✓ Offset range: {min_offset:.1f} to {max_offset:.1f} seconds")
 
     # Check for exact duplicate offsets (jitter should prevent this)
-    offset_counts = {}
-    for offset in offsets:
-        offset_counts[offset] = offset_counts.get(offset, 0) + 1
-
-    duplicates = [off for off, cnt in offset_counts.items() if cnt > 1]
+    duplicates = []
+    if len(set(offsets)) != len(offsets):
+        duplicates = [off for off, cnt in Counter(offsets).items() if cnt > 1]
     if duplicates:
         errors.append(f"Found {len(duplicates)} duplicate offsets (jitter failed)")
     else:
@@ -1136,7 +1072,6 @@ def validate_fixture(fixture: dict) -> tuple[bool, list[str]]:
 
     # Validate 5-beat arc
     print("Validating 5-beat escalation arc...")
-    alert_records = [r for r in records if r.get("_table") == "alerts"]
     if len(alert_records) == 5:
         print(f"  ✓ 5 alert states present")
 
@@ -1189,9 +1124,22 @@ def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Generate or validate demo fixture")
     parser.add_argument("--validate", action="store_true", help="Validate existing fixture instead of generating")
+    parser.add_argument("--no-cache", action="store_true", help="Regenerate even if a cached build matches")
+    parser.add_argument("--pretty", action="store_true", help="Write indented JSON for debugging (bypasses cache)")
+    parser.add_argument("--format", choices=["json", "msgpack"], default="json", help="Fixture file format (default: json)")
+    parser.add_argument("--compress", action="store_true", help="gzip the fixture (writes/reads demo_fixture.<format>.gz)")
     args = parser.parse_args()
 
-    fixture_path = Path(__file__).parent / "demo_fixture.json"
+    if args.pretty and args.format != "json":
+        parser.error("--pretty only applies to --format json")
+
+    if args.format == "msgpack" and msgpack is None:
+        print("❌ --format msgpack requires the msgpack package (pip install msgpack)")
+        exit(1)
+
+    fixture_path = Path(__file__).parent / f"demo_fixture.{args.format}"
+    if args.compress:
+        fixture_path = fixture_path.with_name(fixture_path.name + ".gz")
 
     if args.validate:
         # Validate mode
@@ -1206,8 +1154,7 @@ def main() -> None:
             print("Run without --validate to generate fixture first.")
             return
 
-        with open(fixture_path) as f:
-            fixture = json.load(f)
+        fixture = iter_fixture(fixture_path)
 
         is_valid, errors = validate_fixture(fixture)
 
@@ -1222,12 +1169,26 @@ def main() -> None:
         print("=" * 70)
         print()
 
-        fixture = generate_fixture()
+        cache_path = fixture_cache_path()
 
-        print()
-        print(f"Writing fixture to {fixture_path}...")
-        with open(fixture_path, "w") as f:
-            json.dump(fixture, f, indent=2)
+        # Only the compact, uncompressed JSON form is cached
+        use_cache = args.format == "json" and not (args.no_cache or args.pretty or args.compress)
+
+        if use_cache and cache_path.exists():
+            print(f"Sources unchanged, reusing cached build {cache_path}")
+            restore_cached_fixture(cache_path, fixture_path)
+        else:
+            fixture = generate_fixture()
+
+            print()
+            print(f"Writing fixture to {fixture_path}...")
+            if args.format == "msgpack":
+                write_fixture_msgpack(fixture, fixture_path)
+            else:
+                write_fixture(fixture, fixture_path, pretty=args.pretty)
+            if use_cache:
+                FIXTURE_CACHE_DIR.mkdir(exist_ok=True)
+                shutil.copyfile(fixture_path, cache_path)
 
         print()
         print("=" * 70)
@@ -1238,7 +1199,10 @@ def main() -> None:
         print(f"Size: {fixture_path.stat().st_size / 1024:.1f} KB")
         print()
         print("Run with --validate flag to validate fixture structure:")
-        print(f"  python {Path(__file__).name} --validate")
+        format_flag = f" --format {args.format}" if args.format != "json" else ""
+        if args.compress:
+            format_flag += " --compress"
+        print(f"  python {Path(__file__).name} --validate{format_flag}")
 
 
 if __name__ == "__main__":
@@ -19,6 +19,12 @@ from src.processors.correlate_events import correlate_events_batch
 # Base timestamp matching load_demo_data.py
 BASE_TIME = datetime(2026, 2, 5, 0, 0, 0, tzinfo=timezone.utc)
 
+# Alert columns displayed by main(); avoids pulling unused columns
+ALERT_COLUMNS = (
+    "id,region,threat_level,threat_score,confidence,"
+    "sub_scores,correlation_metadata,created_at,updated_at"
+)
+
 
 async def check_events_exist() -> Dict[str, int]:
     """Check if narrative and movement events exist from Phase 2 processing.
@@ -28,12 +34,15 @@ async def check_events_exist() -> Dict[str, int]:
     """
     client = await get_supabase()
 
-    narrative_response = await client.table("narrative_events").select("id", count="exact").execute()
-    movement_response = await client.table("movement_events").select("id", count="exact").execute()
+    # Independent HEAD count queries (no row payload), so run them concurrently
+    narrative_response, movement_response = await asyncio.gather(
+        client.table("narrative_events").select("id", count="exact", head=True).execute(),
+        client.table("movement_events").select("id", count="exact", head=True).execute(),
+    )
 
     return {
-        "narrative_count": len(narrative_response.data) if narrative_response.data else 0,
-        "movement_count": len(movement_response.data) if movement_response.data else 0,
+        "narrative_count": narrative_response.count or 0,
+        "movement_count": movement_response.count or 0,
     }
 
 
@@ -90,11 +99,6 @@ async def insert_synthetic_events() -> None:
         },
     ]
 
-    for event in narrative_events:
-        await client.table("narrative_events").insert(event).execute()
-
-    print(f"  Inserted {len(narrative_events)} narrative events")
-
     # Synthetic movement events (9 events across phases)
     movement_events = [
         # GREEN phase (2 events)
@@ -183,9 +187,14 @@ async def insert_synthetic_events() -> None:
         },
     ]
 
-    for event in movement_events:
-        await client.table("movement_events").insert(event).execute()
+    # One multi-row insert per table rather than a round-trip per event; the
+    # two tables are independent, so both requests run concurrently
+    await asyncio.gather(
+        client.table("narrative_events").insert(narrative_events).execute(),
+        client.table("movement_events").insert(movement_events).execute(),
+    )
 
+    print(f"  Inserted {len(narrative_events)} narrative events")
     print(f"  Inserted {len(movement_events)} movement events")
     print("  Synthetic events ready for correlation\n")
 
@@ -200,9 +209,10 @@ async def fetch_current_alert() -> Dict[str, Any] | None:
 
     response = (
         await client.table("alerts")
-        .select("*")
+        .select(ALERT_COLUMNS)
         .eq("region", "Taiwan Strait")
         .is_("resolved_at", "null")
+        .limit(1)
         .execute()
     )
 
@@ -1,18 +1,66 @@
 import asyncio
+import importlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import structlog
-from pydantic import ValidationError
-
-# Configure structlog for console output
-structlog.configure(
-    processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer()
-    ],
-    logger_factory=structlog.PrintLoggerFactory(),
-)
+
 logger = structlog.get_logger()
 
+# Fields the LLM output schemas must declare
+NARRATIVE_FIELDS = frozenset({
+    "coordination_score", "synchronized_phrases", "outlet_count",
+    "geographic_focus", "themes", "confidence",
+})
+CLASSIFICATION_FIELDS = frozenset({"category", "location", "confidence", "reasoning"})
+
+# (module, exported name) pairs for the import smoke checks
+LLM_IMPORTS = (
+    ("src.llm.narrative", "detect_narrative_coordination"),
+    ("src.llm.classification", "classify_civilian_post"),
+    ("src.llm.extraction", "extract_entities"),
+    ("src.llm.briefs", "generate_intelligence_brief"),
+)
+PROCESSOR_IMPORTS = (
+    ("src.processors.batch_articles", "process_article_batch"),
+    ("src.processors.batch_posts", "process_post_batch"),
+    ("src.processors.brief_generator", "generate_brief"),
+)
+
+
+def import_name(module_name, name):
+    # Same failure mode as `from module import name`
+    module = importlib.import_module(module_name)
+    if not hasattr(module, name):
+        raise ImportError(f"cannot import name {name!r} from {module_name!r}")
+    return getattr(module, name)
+
+
+def check_schema(model, expected_fields):
+    # Pydantic's ValidationError is also a ValueError, so callers catch both
+    model.model_rebuild(force=True)
+    missing = expected_fields - model.model_fields.keys()
+    if missing:
+        raise ValueError(f"{model.__name__} is missing fields: {sorted(missing)}")
+
+
+def first_error(futures):
+    for future in futures:
+        error = future.exception()
+        if error is not None:
+            return error
+    return None
+
+
+def configure_logging():
+    # Plain key=value console output; a one-shot import check needs neither
+    # timestamps nor JSON encoding per event
+    structlog.configure(
+        processors=[structlog.processors.KeyValueRenderer()],
+        logger_factory=structlog.PrintLoggerFactory(),
+    )
+
+
 async def verify_phase_2():
     logger.info("verification_start", phase="2")
     failures = []
@@ -32,52 +80,39 @@ async def verify_phase_2():
             NarrativeCoordination, PostClassification, EntityExtraction, 
             IntelligenceBrief, ExtractedEntity
         )
-        # Instantiate with dummy data to check Pydantic validation
-        NarrativeCoordination(
-            coordination_score=85,
-            synchronized_phrases=["phrase 1", "phrase 2"],
-            outlet_count=5,
-            geographic_focus="Taiwan Strait",
-            themes=["Theme A"],
-            confidence=90
-        )
+        # Rebuild the schemas and check their fields rather than validating
+        # dummy instances
+        check_schema(NarrativeCoordination, NARRATIVE_FIELDS)
         logger.info("schema_narrative_ok")
-        
+
         # Check PostClassification
-        from src.llm.schemas import MovementCategory
-        PostClassification(
-            category=MovementCategory.convoy,
-            location="Fuzhou",
-            confidence=80,
-            reasoning="Convoy spotted"
-        )
+        check_schema(PostClassification, CLASSIFICATION_FIELDS)
         logger.info("schema_classification_ok")
-        
-    except ValidationError as e:
+
+    except ValueError as e:
         failures.append(f"Schema Validation Error: {e}")
         logger.error("schema_validation_failed", error=str(e))
     except Exception as e:
         failures.append(f"Schema Import/Other Error: {e}")
         logger.error("schema_failed", error=str(e))
 
-    # 3. Import Module Logic (Functions)
-    try:
-        from src.llm.narrative import detect_narrative_coordination
-        from src.llm.classification import classify_civilian_post
-        from src.llm.extraction import extract_entities
-        from src.llm.briefs import generate_intelligence_brief
+    # 3 & 4. Import LLM modules and processors. The modules are independent,
+    # so import them on worker threads to overlap reading them from disk.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        llm_futures = [pool.submit(import_name, *pair) for pair in LLM_IMPORTS]
+        processor_futures = [pool.submit(import_name, *pair) for pair in PROCESSOR_IMPORTS]
+
+    e = first_error(llm_futures)
+    if e is None:
         logger.info("llm_modules_import_ok")
-    except ImportError as e:
+    else:
         failures.append(f"LLM Module Import Error: {e}")
         logger.error("llm_modules_import_failed", error=str(e))
 
-    # 4. Import Processors
-    try:
-        from src.processors.batch_articles import process_article_batch
-        from src.processors.batch_posts import process_post_batch
-        from src.processors.brief_generator import generate_brief
+    e = first_error(processor_futures)
+    if e is None:
         logger.info("processors_import_ok")
-    except ImportError as e:
+    else:
         failures.append(f"Processor Import Error: {e}")
         logger.error("processors_import_failed", error=str(e))
 
@@ -89,4 +124,5 @@ async def verify_phase_2():
         logger.info("verification_success", status="all_systems_go")
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(verify_phase_2())
@@ -50,11 +50,14 @@ def check_corr_01_time_window() -> bool:
 
     base_time = datetime(2026, 2, 5, 12, 0, 0, tzinfo=timezone.utc)
 
+    # ISO timestamps for every hour offset the mocks use, built once
+    iso_at = {h: (base_time + timedelta(hours=h)).isoformat() for h in (-36, 0, 36, 80)}
+
     # Mock narrative event
     narrative_events = [
         {
             "id": 1,
-            "created_at": base_time.isoformat(),
+            "created_at": iso_at[0],
             "coordination_score": 50,
             "outlet_count": 3,
             "synchronized_phrases": ["phrase1", "phrase2"],
@@ -67,7 +70,7 @@ def check_corr_01_time_window() -> bool:
         # Within window (36h before)
         {
             "id": 101,
-            "created_at": (base_time - timedelta(hours=36)).isoformat(),
+            "created_at": iso_at[-36],
             "category": "naval",
             "location_lat": 24.5,
             "location_lon": 120.0,
@@ -75,7 +78,7 @@ def check_corr_01_time_window() -> bool:
         # Within window (36h after)
         {
             "id": 102,
-            "created_at": (base_time + timedelta(hours=36)).isoformat(),
+            "created_at": iso_at[36],
             "category": "convoy",
             "location_lat": 24.8,
             "location_lon": 119.5,
@@ -83,7 +86,7 @@ def check_corr_01_time_window() -> bool:
         # Outside window (80h after - beyond 72h)
         {
             "id": 103,
-            "created_at": (base_time + timedelta(hours=80)).isoformat(),
+            "created_at": iso_at[80],
             "category": "naval",
             "location_lat": 25.0,
             "location_lon": 120.5,
@@ -4,6 +4,7 @@ CRITICAL: Uses acreate_client() for async support and realtime subscriptions.
 DO NOT use create_client() - it's sync-only and doesn't support realtime.
 """
 
+import asyncio
 import os
 
 from dotenv import load_dotenv
@@ -15,6 +16,9 @@ load_dotenv()
 # Module-level singleton
 _client: AsyncClient | None = None
 
+# Serializes first-time creation so concurrent callers share one client
+_client_lock = asyncio.Lock()
+
 
 async def get_supabase() -> AsyncClient:
     """Get or create the async Supabase client singleton.
@@ -30,19 +34,24 @@ async def get_supabase() -> AsyncClient:
     if _client is not None:
         return _client
 
-    # Get credentials from environment
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_KEY")
+    async with _client_lock:
+        # Another caller may have finished creating it while we waited
+        if _client is not None:
+            return _client
+
+        # Get credentials from environment
+        url = os.getenv("SUPABASE_URL")
+        key = os.getenv("SUPABASE_KEY")
 
-    if not url or not key:
-        raise ValueError(
-            "Missing required environment variables: SUPABASE_URL and SUPABASE_KEY must be set. "
-            "Copy .env.example to .env and fill in your credentials."
-        )
+        if not url or not key:
+            raise ValueError(
+                "Missing required environment variables: SUPABASE_URL and SUPABASE_KEY must be set. "
+                "Copy .env.example to .env and fill in your credentials."
+            )
 
-    # Create async client with realtime support
-    _client = await acreate_client(url, key)
-    return _client
+        # Create async client with realtime support
+        _client = await acreate_client(url, key)
+        return _client
 
 
 async def close_supabase() -> None:
@@ -19,10 +19,27 @@ from typing import Literal
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json fallback in load_fixture
+    orjson = None
+
 from src.database.client import get_supabase
 
 logger = structlog.get_logger()
 
+# Valid Supabase columns per table (excluding auto-generated 'id'). Built once
+# at import rather than on every inserted record.
+VALID_COLUMNS: dict[str, frozenset[str]] = {
+    "articles": frozenset({"url", "title", "domain", "published_at", "tone_score", "language", "source_country"}),
+    "social_posts": frozenset({"telegram_id", "channel", "text", "timestamp", "views"}),
+    "vessel_positions": frozenset({"mmsi", "ship_name", "latitude", "longitude", "speed", "course", "timestamp"}),
+    "narrative_events": frozenset({"event_type", "summary", "confidence", "source_ids", "detected_at"}),
+    "movement_events": frozenset({"event_type", "vessel_mmsi", "location_lat", "location_lon", "description", "detected_at"}),
+    "alerts": frozenset({"region", "threat_level", "threat_score", "confidence", "severity", "title", "description", "event_ids", "sub_scores", "correlation_metadata", "updated_at", "created_at", "resolved_at"}),
+    "briefs": frozenset({"title", "summary", "key_developments", "generated_at", "threat_level", "confidence", "evidence_chain", "timeline", "information_gaps", "collection_priorities", "narrative_event_ids", "movement_event_ids"}),
+}
+
 
 class DemoEngine:
     """Async demo playback engine for Dragon Watch.
@@ -63,8 +80,13 @@ class DemoEngine:
                 "Run: python scripts/generate_demo_fixture.py"
             )
 
-        with open(fixture_path) as f:
-            self.fixture = json.load(f)
+        # orjson parses straight from bytes; its JSONDecodeError subclasses
+        # json.JSONDecodeError, so callers see the same exception either way
+        if orjson is not None:
+            self.fixture = orjson.loads(fixture_path.read_bytes())
+        else:
+            with open(fixture_path) as f:
+                self.fixture = json.load(f)
 
         logger.info(
             "fixture_loaded",
@@ -312,17 +334,6 @@ class DemoEngine:
         Returns:
             dict: Cleaned data with only valid columns
         """
-        # Define valid columns per table (excluding auto-generated 'id')
-        valid_columns: dict[str, set[str]] = {
-            "articles": {"url", "title", "domain", "published_at", "tone_score", "language", "source_country"},
-            "social_posts": {"telegram_id", "channel", "text", "timestamp", "views"},
-            "vessel_positions": {"mmsi", "ship_name", "latitude", "longitude", "speed", "course", "timestamp"},
-            "narrative_events": {"event_type", "summary", "confidence", "source_ids", "detected_at"},
-            "movement_events": {"event_type", "vessel_mmsi", "location_lat", "location_lon", "description", "detected_at"},
-            "alerts": {"region", "threat_level", "threat_score", "confidence", "severity", "title", "description", "event_ids", "sub_scores", "correlation_metadata", "updated_at", "created_at", "resolved_at"},
-            "briefs": {"title", "summary", "key_developments", "generated_at", "threat_level", "confidence", "evidence_chain", "timeline", "information_gaps", "collection_priorities", "narrative_event_ids", "movement_event_ids"},
-        }
-
         cleaned = dict(data)
 
         # Rename created_at -> detected_at for event tables
@@ -330,8 +341,9 @@ class DemoEngine:
             cleaned["detected_at"] = cleaned.pop("created_at")
 
         # Filter to valid columns only
-        if table in valid_columns:
-            cleaned = {k: v for k, v in cleaned.items() if k in valid_columns[table]}
+        valid_columns = VALID_COLUMNS.get(table)
+        if valid_columns is not None:
+            cleaned = {k: v for k, v in cleaned.items() if k in valid_columns}
 
         # Fix briefs: timeline must be text[] array, not a plain string
         if table == "briefs" and "timeline" in cleaned and isinstance(cleaned["timeline"], str):
@@ -350,7 +362,8 @@ class DemoEngine:
 
         Handles:
         - articles: upsert on "url" conflict
-        - social_posts, vessel_positions: plain insert
+        - social_posts: upsert on "channel,telegram_id" conflict
+        - vessel_positions: upsert on "mmsi,timestamp", skipping existing rows
         - narrative_events, movement_events: plain insert
         - alerts: INSERT stores id, UPDATE uses stored id
         - briefs: plain insert
@@ -365,9 +378,22 @@ class DemoEngine:
             # Route to correct table with appropriate insert/upsert logic
             if table == "articles":
                 # Upsert on URL conflict
-                result = await client.table(table).upsert(data).execute()
+                result = await client.table(table).upsert(data, on_conflict="url").execute()
                 logger.info("record_inserted", table=table, action="upsert", url=data.get("url"))
 
+            elif table == "social_posts":
+                # Upsert on the (channel, telegram_id) key from migration 00002,
+                # so playback after load_demo_data doesn't hit duplicate keys
+                result = await client.table(table).upsert(data, on_conflict="channel,telegram_id").execute()
+                logger.info("record_inserted", table=table, action="upsert", telegram_id=data.get("telegram_id"))
+
+            elif table == "vessel_positions":
+                # Positions are immutable observations; keep the existing row
+                result = await client.table(table).upsert(
+                    data, on_conflict="mmsi,timestamp", ignore_duplicates=True
+                ).execute()
+                logger.info("record_inserted", table=table, action="upsert", mmsi=data.get("mmsi"))
+
             elif table == "alerts":
                 if action == "insert":
                     # First alert - insert and store ID
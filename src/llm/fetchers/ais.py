@@ -48,7 +48,10 @@ async def flush_positions(positions: list[dict]) -> int:
 
     try:
         supabase = await get_supabase()
-        response = await supabase.table("vessel_positions").insert(positions).execute()
+        # Skip reports already stored under the (mmsi, timestamp) key
+        response = await supabase.table("vessel_positions").upsert(
+            positions, on_conflict="mmsi,timestamp", ignore_duplicates=True
+        ).execute()
         return len(response.data) if response.data else 0
     except Exception as e:
         print(f"Error flushing positions to database: {e}")
@@ -178,8 +178,11 @@ async def scrape_and_store_channels(
             # Get Supabase client
             supabase = await get_supabase()
 
-            # Insert messages to Supabase
-            response = await supabase.table("social_posts").insert(messages).execute()
+            # Upsert so re-scraped messages refresh view counts instead of
+            # violating the (channel, telegram_id) key
+            response = await supabase.table("social_posts").upsert(
+                messages, on_conflict="channel,telegram_id"
+            ).execute()
 
             count = len(response.data) if response.data else 0
             total_count += count
@@ -8,6 +8,7 @@ Pattern: Follows established batch processor pattern from batch_articles.py and
 
 import asyncio
 import structlog
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Tuple
 
@@ -84,6 +85,11 @@ async def fetch_movement_events(hours: int = 72) -> List[Dict[str, Any]]:
     return response.data
 
 
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp, handling both 'Z' and '+00:00' suffixes."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 def match_events_by_time_window(
     narrative_events: List[Dict[str, Any]],
     movement_events: List[Dict[str, Any]],
@@ -99,6 +105,16 @@ def match_events_by_time_window(
     Returns:
         List of dicts with structure: {"narrative": event, "movements": [matched_events]}
     """
+    # Parse each movement timestamp once and sort, so each narrative event
+    # finds its window with two binary searches instead of a full scan
+    timed_movements = sorted(
+        (_parse_timestamp(move_event["created_at"]), idx)
+        for idx, move_event in enumerate(movement_events)
+        if move_event.get("created_at")
+    )
+    movement_times = [move_ts for move_ts, _ in timed_movements]
+    window = timedelta(hours=window_hours)
+
     matches = []
 
     for narr_event in narrative_events:
@@ -107,25 +123,17 @@ def match_events_by_time_window(
         if not narr_ts_str:
             continue
 
-        # Handle both 'Z' and '+00:00' suffixes
-        narr_ts = datetime.fromisoformat(narr_ts_str.replace("Z", "+00:00"))
+        narr_ts = _parse_timestamp(narr_ts_str)
 
         # Find all movement events within window
-        matched_movements = []
-        for move_event in movement_events:
-            move_ts_str = move_event.get("created_at")
-            if not move_ts_str:
-                continue
-
-            move_ts = datetime.fromisoformat(move_ts_str.replace("Z", "+00:00"))
-
-            # Check if within window
-            time_diff = abs((narr_ts - move_ts).total_seconds() / 3600)  # hours
-            if time_diff <= window_hours:
-                matched_movements.append(move_event)
+        lo = bisect_left(movement_times, narr_ts - window)
+        hi = bisect_right(movement_times, narr_ts + window)
 
         # Only include narrative events that match at least one movement event
-        if matched_movements:
+        if lo < hi:
+            # Keep matched movements in their original (fetch) order
+            matched_idx = sorted(idx for _, idx in timed_movements[lo:hi])
+            matched_movements = [movement_events[idx] for idx in matched_idx]
             matches.append({"narrative": narr_event, "movements": matched_movements})
 
     return matches
@@ -351,6 +359,16 @@ async def correlate_events_batch() -> Dict[str, Any]:
 
         logger.info("temporal_matches_found", count=len(matches))
 
+        # Region membership depends only on the movement, so test each one
+        # once here rather than again for every narrative it matches
+        in_strait_ids = {
+            movement["id"]
+            for movement in movement_events
+            if movement.get("location_lat") is not None
+            and movement.get("location_lon") is not None
+            and is_in_taiwan_strait(movement["location_lat"], movement["location_lon"])
+        }
+
         # 3. Calculate composite scores for each match
         correlations = []
 
@@ -364,14 +382,7 @@ async def correlate_events_batch() -> Dict[str, Any]:
             )
 
             # Check if ANY matched movement has location in Taiwan Strait
-            movement_geo = False
-            for movement in movements:
-                lat = movement.get("location_lat")
-                lon = movement.get("location_lon")
-                if lat is not None and lon is not None:
-                    if is_in_taiwan_strait(lat, lon):
-                        movement_geo = True
-                        break
+            movement_geo = any(m["id"] in in_strait_ids for m in movements)
 
             # Both must match for geographic correlation
             geo_match = narrative_geo and movement_geo
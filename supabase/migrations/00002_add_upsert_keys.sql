@@ -0,0 +1,22 @@
+-- Dragon Watch Upsert Keys
+-- Migration 00002: Unique keys so social_posts and vessel_positions can be upserted
+
+-- Drop duplicate rows left by earlier insert-only loads, keeping the oldest copy
+DELETE FROM social_posts a
+USING social_posts b
+WHERE a.id > b.id
+  AND a.channel = b.channel
+  AND a.telegram_id = b.telegram_id;
+
+DELETE FROM vessel_positions a
+USING vessel_positions b
+WHERE a.id > b.id
+  AND a.mmsi = b.mmsi
+  AND a.timestamp = b.timestamp;
+
+-- Telegram message ids are only unique within a channel
+CREATE UNIQUE INDEX uq_social_posts_channel_telegram_id ON social_posts(channel, telegram_id);
+
+-- Replaces the plain (mmsi, timestamp) lookup index from 00001
+DROP INDEX IF EXISTS idx_vessel_positions_mmsi_timestamp;
+CREATE UNIQUE INDEX uq_vessel_positions_mmsi_timestamp ON vessel_positions(mmsi, timestamp);